@@ -6,16 +6,18 @@ duplicating.
 """
 
 import logging
+from typing import Collection
 from pandas import DataFrame
 from numpy import percentile
 
-def clear_stop_words(text: str, stop_words: list[str]) -> str:
+def clear_stop_words(text: str, stop_words: Collection[str]) -> str:
     """
     Takes the text and returns it without given list of stopwords
 
     Arguments:
     text(str): an original text as a single string
-    stop_words(list[str]): a list of strings, each being a stopword
+    stop_words(Collection[str]): a collection of strings, each being a stopword;
+    a set or frozenset makes checking each token constant in time
 
     Returns:
     text(str): a text, cleared from stopwords
@@ -107,5 +109,7 @@ def get_unique_pairs(lects: list[str]) -> list[tuple[str, str]]:
         for j in set(lects):
             if (i != j) and (i, j) not in unique_pairs and (j, i) not in unique_pairs:
                 unique_pairs.append((i, j))
-    logging.info("Unique pairs: %s", ";".join([i[0] + i[1] for i in unique_pairs]))
+    # the joined string is built only if it is going to be logged
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("Unique pairs: %s", ";".join([i[0] + i[1] for i in unique_pairs]))
     return unique_pairs
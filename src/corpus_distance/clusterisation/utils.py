@@ -3,15 +3,47 @@ Clusterisation utils module contain functions that aid in clusterisation
 by preparing existing data for the clustering functions.
 """
 
+from functools import cache
 from os.path import dirname, isdir, join, realpath
 import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from numpy import float64, fromiter, ndarray, tril_indices, zeros
 from Bio import Phylo
 from Bio.Phylo.TreeConstruction import _DistanceMatrix
 
+def create_distance_array(
+        pairwise_distances: list[tuple[tuple[str, str], int|float]],
+        lects: list[str]) -> tuple[list[str], ndarray]:
+    """
+    Takes list of distances between pairs of lects and names of lects,
+    and returns the order of lects with a square array, which lower
+    triangle holds distances between them.
+
+    Parameters:
+        pairwise_distances(list[tuple[tuple[str, str], int|float]]): a 1d-array of distances
+        between given lects with lect names
+        lects(list[str]): names of lects
+    Returns:
+        ordered_lects(list[str]): names of lects in the order of array rows
+        distance_array(ndarray): a square float64 array with distances
+        below the main diagonal, and zeros elsewhere
+    """
+    # index distances by unordered lect pair once, instead of scanning
+    # the whole list of distances for each cell of the matrix
+    lookup = {frozenset(d[0]): d[1] for d in pairwise_distances}
+    ordered_lects = list(set(lects))
+    idx_i, idx_j = tril_indices(len(ordered_lects), k=-1)
+    distance_array = zeros((len(ordered_lects), len(ordered_lects)), dtype=float64)
+    distance_array[idx_i, idx_j] = fromiter(
+        (lookup[frozenset((ordered_lects[i], ordered_lects[j]))]
+         for i, j in zip(idx_i, idx_j)),
+        dtype=float64, count=len(idx_i))
+    return ordered_lects, distance_array
+
 def create_distance_matrix(
         pairwise_distances: list[tuple[tuple[str, str], int|float]],
-        lects: list[str]) -> list[list[int|float]]:
+        lects: list[str]) -> _DistanceMatrix:
     """
     Takes list of distances between pairs of lects and names of lects,
     and returns lower triangular distance matrix.
@@ -23,17 +55,9 @@ def create_distance_matrix(
     Returns:
         distance_matrix(_DistanceMatrix): a DistanceMatrix between given lects
     """
-    final_matrix = []
-    ordered_lects = list(set(lects))
-    for i in range(len(ordered_lects)):
-        final_matrix.append([])
-        for j in range(len(ordered_lects)):
-            if j < i:
-                dist =\
-                    [d[1] for d in pairwise_distances if\
-                        set([ordered_lects[i], ordered_lects[j]]) == set([d[0][0], d[0][1]])][0]
-                final_matrix[i].append(dist)
-        final_matrix[i].append(0)
+    ordered_lects, distance_array = create_distance_array(pairwise_distances, lects)
+    # BioPython expects a ragged lower triangular list, including the diagonal
+    final_matrix = [row[:i + 1].tolist() for i, row in enumerate(distance_array)]
     distance_matrix = _DistanceMatrix(ordered_lects, final_matrix)
     return distance_matrix
 
@@ -55,18 +79,30 @@ def detect_outgroup(tree: Phylo.BaseTree.Tree, outgroup: str, data_name: str,
         raise ValueError("Tree is unrooted, not possible to detect outgroup")
     if (outgroup in [tree.clade.clades[0].name, tree.clade.clades[1].name]):
         outgroup_clade = 0 if tree.clade.clades[0].name == outgroup else 1
-        ingroup_clade = 1 if tree.clade.clades[0].name == outgroup else 0
-        with open(join(store_path, metrics + ".info"), 'w', encoding='utf-8') as out:
-            out.write(f"{data_name}\tCORRECT\t{tree.clade.clades[outgroup_clade].branch_length}\t\
-                      {tree.clade.clades[ingroup_clade].branch_length}")
+        ingroup_clade = 1 - outgroup_clade
+        status = "CORRECT"
+        outgroup_length = tree.clade.clades[outgroup_clade].branch_length
+        ingroup_length = tree.clade.clades[ingroup_clade].branch_length
     else:
-        with open(join(store_path, metrics + ".info"), 'w', encoding='utf-8') as out:
-            out.write(f"{data_name}\tINCORRECT\tNA\tNA")
-    Phylo.write(tree, join(store_path, metrics + ".newick"), 'newick')
+        status, outgroup_length, ingroup_length = "INCORRECT", "NA", "NA"
+    with open(join(store_path, f"{metrics}.info"), 'w', encoding='utf-8') as out:
+        out.write(f"{data_name}\t{status}\t{outgroup_length}\t{ingroup_length}")
+    Phylo.write(tree, join(store_path, f"{metrics}.newick"), 'newick')
+
+
+@cache
+def _configure_font() -> None:
+    """
+    Sets matplotlib font for tree visualisation; cached
+    in order to change global settings only once.
+    """
+    font = {'family':'DejaVu Sans', 'weight':'normal', 'size':20}
+    matplotlib.rc('font', **font)
 
 
 def visualise_tree(tree: Phylo.BaseTree.Tree, metrics: str, data_name: str,
-                   store_path: str = dirname(realpath(__file__))) -> None:
+                   store_path: str = dirname(realpath(__file__)),
+                   axes: Axes | None = None) -> None:
     """
     Visualises tree with matplotlib.
 
@@ -74,12 +110,21 @@ def visualise_tree(tree: Phylo.BaseTree.Tree, metrics: str, data_name: str,
         tree(Phylo.BaseTree.Tree): BioPython tree for visualisation
         metrics(str): name of metrics, with which tree was built
         data_name(str): name of data, for which tree was built
+        store_path(str): a path to store data
+        axes(Axes | None): axes to draw the tree on; if not provided,
+        a new figure is created and closed after saving
     """
-    font = {'family':'DejaVu Sans', 'weight':'normal', 'size':20}
-    matplotlib.rc('font', **font)
-    fig = plt.figure(figsize=(40, 15))
+    _configure_font()
+    # the figure is closed only when created here,
+    # as the given axes may be reused by the caller
+    own_figure = axes is None
+    if own_figure:
+        fig = plt.figure(figsize=(40, 15))
+        axes = fig.add_subplot(1, 1, 1)
+    else:
+        fig = axes.figure
     fig.suptitle(f'{metrics} of {data_name}', fontsize=36)
-    axes = fig.add_subplot(1, 1, 1)
     Phylo.draw(tree, axes=axes, show_confidence=False, do_show=False)
-    plt.savefig(join(store_path, "phylogeny_" + metrics + "_" + data_name + ".png"))
-    plt.close()
+    fig.savefig(join(store_path, f"phylogeny_{metrics}_{data_name}.png"))
+    if own_figure:
+        plt.close(fig)
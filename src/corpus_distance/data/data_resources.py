@@ -7,14 +7,22 @@ Also a wrapping module for the default configuration
 """
 
 
+from importlib import resources
 import json
 from pandas import read_csv
-from pkg_resources import resource_stream
 
 
 
-data_stream = resource_stream(__name__, "gospels.csv")
-data_df = read_csv(data_stream)
+data_files = resources.files(__package__)
 
-config_stream = resource_stream(__name__, "config.json")
-config = json.load(config_stream)
+with data_files.joinpath("gospels.csv").open('rb') as data_stream:
+    try:
+        # Arrow-backed parsing is faster and stores texts contiguously;
+        # pyarrow is optional, so the default parser is kept as a fallback
+        data_df = read_csv(data_stream, engine='pyarrow', dtype_backend='pyarrow')
+    except ImportError:
+        data_df = read_csv(data_stream)
+data_df = data_df.astype({'lect': 'category'})
+
+with data_files.joinpath("config.json").open('r', encoding='utf-8') as config_stream:
+    config = json.load(config_stream)
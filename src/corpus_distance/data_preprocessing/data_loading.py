@@ -9,13 +9,36 @@ a demo dataset of three standard Slavic Gospels (Slovak, Slovenian, Croatian)
 
 
 import os
-from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from math import ceil
 from pandas import DataFrame
-import corpus_distance.data.data_resources as datares
+from corpus_distance.data.data_resources import data_df
 
 
 
+def _read_one(path: str, split: int = 1) -> tuple[str, str]:
+    """
+    Reads a single file of a lect and truncates its text
+    to the given size share.
+
+    Args:
+        path (string): path to the file of the lect,
+        named in TEXT.LECT.txt style.
+
+        split (int): share (from 0 to 1).
+
+    Returns:
+        record: A tuple of the text and the lect name.
+    """
+    lect = os.path.basename(path).split('.')[-2]
+    with open(path, 'r', encoding='utf-8') as inp:
+        content = inp.read().lower().split()
+    split_text = ' '.join(content) if split == 1 \
+        else ' '.join(content[:ceil(len(content)*split)])
+    return split_text, lect
+
+
 def load_data(content_directory: str , split: int = 1) -> DataFrame:
     """
     Takes directory and size share,
@@ -34,17 +57,13 @@ def load_data(content_directory: str , split: int = 1) -> DataFrame:
     """
     if (split < 0 or split > 1):
         raise ValueError("Incorrect split, should be between 0 and 1")
-    texts = {}
-    for filename in os.listdir(content_directory):
-        f = os.path.join(content_directory, filename)
+    with os.scandir(content_directory) as it:
         # checking if it is a file
-        if os.path.isfile(f):
-            lect = filename.split('.')[-2]
-            with open(f, 'r', encoding='utf-8') as inp:
-                content = inp.read().lower().strip().split(' ')
-                split_text = ' '.join(list(islice(content, ceil(len(content)*split))))
-                texts[split_text] = lect
-    df = DataFrame(texts.items(), columns=['text', 'lect'])
+        paths = [entry.path for entry in it if entry.is_file()]
+    # reading is I/O-bound, so files are read concurrently in threads
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(paths)))) as ex:
+        records = list(ex.map(partial(_read_one, split=split), paths))
+    df = DataFrame.from_records(records, columns=['text', 'lect'])
     return df
 
 
@@ -60,4 +79,6 @@ def load_default_data() -> DataFrame:
         df: A dataframe with texts as first column and lect names as a second. 
 
     """
-    return datares.data_df
+    # the dataset is parsed once on import; a shallow copy keeps
+    # the shared frame safe from adding columns downstream
+    return data_df.copy(deep=False)
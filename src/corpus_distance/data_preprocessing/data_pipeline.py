@@ -39,8 +39,11 @@ def assemble_dataset(
         if path_to_folder == 'default' \
         else loading.load_data(path_to_folder, split)
     lects = cdutils.get_lects_from_dataframe(df)
-    lects_with_topics = tm.get_topic_words_for_lects(df, lects, lda_params)
-    df = tm.add_thematic_modelling(df, lects_with_topics, topic_modelling)
+    # texts without topic words are used only when they substitute
+    # the original ones, so otherwise LDA training is skipped
+    if topic_modelling:
+        lects_with_topics = tm.get_topic_words_for_lects(df, lects, lda_params)
+        df = tm.add_thematic_modelling(df, lects_with_topics, topic_modelling)
     vecs = vec.create_vectors_for_lects(df, fasttext_params)
     df = sp.split_lects_by_n_grams(df)
     df = freqscore.count_n_grams_frequencies(df)
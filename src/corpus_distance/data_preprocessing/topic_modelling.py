@@ -4,7 +4,8 @@ from the topic words, relevant for particular
 documents or document genres.
 """
 
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from dataclasses import dataclass
 
 from pandas import DataFrame
@@ -24,11 +25,68 @@ class LDAParams:
     alpha(str): alpha rate
     epochs(int): epochs number
     passes(int): passes for each epoch
+    workers(int): number of processes that train models
+    for different lects in parallel; with more than one,
+    the calling script should run the pipeline under
+    if __name__ == "__main__": guard, as the processes
+    re-import it with spawn and forkserver start methods
+    (default on Windows and macOS)
     """
     num_topics: int = 10
     alpha: str = "auto"
     epochs: int = 300
     passes: int = 500
+    workers: int = 1
+
+    def __post_init__(self):
+        """
+        Validates parameters once, on construction, so that
+        invalid ones fail before training models for each lect
+        """
+        if self.num_topics < 1:
+            raise ValueError("Number of topics should be positive")
+        if self.epochs < 1:
+            raise ValueError("Number of epochs should be positive")
+        if self.passes < 1:
+            raise ValueError("Number of passes should be positive")
+        if self.workers < 1:
+            raise ValueError("Number of workers should be positive")
+
+def build_topic_words_for_lect(
+    texts: list[str],
+    params: LDAParams = LDAParams()) -> list[str]:
+    """
+    Takes texts of a single lect and returns
+    their topic words with LDA model.
+
+    Arguments:
+        texts(list[str]): texts of the lect
+        params(LDAParams): a dictionary with possible 
+        parameters for LdaModel
+
+    Returns:
+        lect_topic_words(list[str]): topic words for the texts
+    """
+    # texts are split lazily, so that only one of them is held
+    # as a list of tokens at a time; the corpus itself stays a list,
+    # as LdaModel iterates over it for each pass
+    common_dictionary = Dictionary(text.split(' ') for text in texts)
+
+    common_corpus = [
+        common_dictionary.doc2bow(text.split(' ')) for text in texts
+        ]
+
+    lda = LdaModel(
+        common_corpus, id2word=common_dictionary,
+        num_topics=params.num_topics, alpha=params.alpha,
+        iterations=params.epochs, passes=params.passes)
+
+    # fetching terms of all the topics in a single call;
+    # with id2word set, the terms are already words
+    topics = lda.show_topics(num_topics=-1, num_words=10, formatted=False)
+    lect_topic_words = {word for _, terms in topics for word, _ in terms}
+
+    return sorted(lect_topic_words)
 
 def get_topic_words_for_lects(
     df: DataFrame, lects: list[str],
@@ -50,29 +108,17 @@ def get_topic_words_for_lects(
     """
     if 'lect' not in df.columns or 'text' not in df.columns:
         raise ValueError("No either \'lect\' or \'text\' columns")
-    topic_words = {}
-    for lect in lects:
-        list_of_texts_split = [
-            i.split(' ') for i in list(df[df['lect'] == lect]['text'])
-            ]
-        common_dictionary = Dictionary(list_of_texts_split)
-
-        common_corpus = [
-            common_dictionary.doc2bow(text) for text in list_of_texts_split
-            ]
-
-        lda = LdaModel(
-            common_corpus,
-            num_topics=params.num_topics, alpha=params.alpha,
-            iterations=params.epochs, passes=params.passes)
-
-        lect_topic_words = []
-
-        for i in range(params.num_topics):
-            for j in lda.get_topic_terms(i):
-                lect_topic_words.append(common_dictionary[j[0]])
-
-        topic_words[lect] = list(set(lect_topic_words))
+    # partitioning texts by lect once, instead of filtering
+    # the whole dataframe for each lect
+    groups = df.groupby('lect', sort=False, observed=True)['text'].apply(list)
+    texts = [groups[lect] for lect in lects]
+    if params.workers == 1:
+        return dict(zip(lects, map(build_topic_words_for_lect, texts, repeat(params))))
+    # models of different lects share no state, so they may be trained
+    # in separate processes
+    with ProcessPoolExecutor(max_workers=max(1, min(len(lects), params.workers))) as ex:
+        topic_words = dict(zip(lects, ex.map(
+            build_topic_words_for_lect, texts, repeat(params))))
     return topic_words
 
 def add_thematic_modelling(
@@ -92,15 +138,18 @@ def add_thematic_modelling(
         substitute(bool): whether a text without stop words
         substitutes the original, or not
     Returns:
-        theme_df(DataFrame): a deep copy of the original dataframe,
+        theme_df(DataFrame): a shallow copy of the original dataframe,
         enriched with text without topic words
     """
     if 'lect' not in df.columns or 'text' not in df.columns:
         raise ValueError("No either \'lect\' or \'text\' columns")
-    theme_df = deepcopy(df)
-    theme_df['text_topic_normalised'] = theme_df.apply(
-        lambda x: clear_stop_words(x['text'], topic_words[x['lect']]),
-        axis = 1)
+    theme_df = df.copy(deep=False)
+    # building lookup sets once per lect, not once per text
+    topic_words_sets = {lect: frozenset(words) for lect, words in topic_words.items()}
+    theme_df['text_topic_normalised'] = [
+        clear_stop_words(text, topic_words_sets[lect]) for text, lect in zip(
+            theme_df['text'].to_numpy(), theme_df['lect'].to_numpy())
+        ]
     if substitute:
         theme_df['text'] = theme_df['text_topic_normalised']
     return theme_df
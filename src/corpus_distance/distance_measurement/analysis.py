@@ -3,17 +3,167 @@ Analysis module provides data for further qualitative investigation
 into the results of the metrics inner workings.
 """
 
-from os.path import dirname, isdir, join, realpath
-from pandas import DataFrame
+import csv
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+from os import sep as _SEP
+from os.path import dirname, isdir, realpath
+from typing import Literal
+
+# n-grams may contain both commas and quotes, e.g. "^,$",
+# so only the minimal quoting is kept, and no escaping is used
+csv.register_dialect(
+    "corpus_distance", delimiter=",", quotechar='"',
+    quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+
+# rows are short and numerous, so a bigger buffer
+# makes for fewer write syscalls than the default 8 KB
+_BUFFER_SIZE = 1 << 18
+
+@lru_cache(maxsize=64)
+def _ensure_dir(path: str) -> None:
+    """
+    Checks that the directory exists; as the function is called
+    for each pair of lects with the same path, successful checks
+    are cached
+
+    Parameters:
+        path(str): a path to store data
+    """
+    if not isdir(path):
+        raise ValueError(f'Path {path} does not exist')
+
+def _extend_hybrid_columns(
+        columns: tuple[list, list, list, list],
+        diffs: dict,
+        label: str,
+        own: int) -> None:
+    """
+    Extends columns with hybrid results for n-grams of one lect,
+    at once for each n-gram instead of appending values row by row.
+
+    Parameters:
+        columns(tuple[list, list, list, list]): n-grams of the first lect,
+        n-grams of the second lect, names of metrics and distances
+        diffs(dict): n-grams as keys, and tuples of other n-grams
+        and metric as values
+        label(str): name of metrics for the third column
+        own(int): index of the column for n-grams of this lect, either 0 or 1
+    """
+    for i, other_lect_n_grams in diffs.items():
+        # n-grams without any matches produce no rows
+        if not other_lect_n_grams:
+            continue
+        other_n_grams, distances = zip(*other_lect_n_grams)
+        columns[own].extend(repeat(i, len(other_n_grams)))
+        columns[1 - own].extend(other_n_grams)
+        columns[2].extend(repeat(label, len(other_n_grams)))
+        columns[3].extend(distances)
+
+def _columns_for_analysis(
+        data_for_analysis: tuple[dict, dict],
+        metrics_name: str) -> tuple[list, list, list, list]:
+    """
+    Gathers data for analysis into columns, shared by all the formats
+
+    Parameters:
+        data_for_analysis(tuple[dict, dict]): dicts with n-grams as keys, 
+        and tuples of other n-grams and metric as values for both DistRank
+        and hybrid
+        metrics_name(str): name of metrics
+    Returns:
+        columns(tuple[list, list, list, list]): n-grams of the first lect,
+        n-grams of the second lect, names of metrics and distances
+    """
+    columns = ([], [], [], [])
+    dist_rank_for_analysis, hybrid_for_analysis = data_for_analysis
+    if dist_rank_for_analysis:
+        columns[0].extend(dist_rank_for_analysis.keys())
+        columns[1].extend(repeat("id.", len(dist_rank_for_analysis)))
+        columns[2].extend(
+            repeat(metrics_name + " - DistRank", len(dist_rank_for_analysis)))
+        columns[3].extend(dist_rank_for_analysis.values())
+    if hybrid_for_analysis:
+        # n-grams of the first lect go to the first column for the first dict,
+        # and to the second column for the second one
+        for own, diffs in enumerate(hybrid_for_analysis):
+            if diffs:
+                _extend_hybrid_columns(columns, diffs, metrics_name + " - hybrid", own)
+    return columns
+
+def _write_columnar(
+        values: tuple[list, list, list, list],
+        columns: list[str],
+        path: str,
+        output_format: str) -> None:
+    """
+    Saves columns of data for analysis to .parquet or .feather file
+
+    Parameters:
+        values(tuple[list, list, list, list]): n-grams of the first lect,
+        n-grams of the second lect, names of metrics and distances
+        columns(list[str]): names of columns
+        path(str): a path to the file
+        output_format(str): format of the file, either "parquet" or "feather"
+    """
+    # pyarrow is optional and slow to import,
+    # so it is imported only for columnar formats
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+        from pyarrow import feather, parquet
+    except ImportError as e:
+        raise ImportError(f"pyarrow is required for {output_format} format") from e
+    table = pa.table({
+        columns[0]: pa.array(values[0], type=pa.string()),
+        columns[1]: pa.array(values[1], type=pa.string()),
+        columns[2]: pa.array(values[2], type=pa.string()),
+        columns[3]: pa.array(values[3], type=pa.float32())
+        })
+    if output_format == "parquet":
+        parquet.write_table(table, path, compression="zstd")
+    else:
+        feather.write_feather(table, path)
+
+@dataclass
+class AnalysisParameters:
+    """
+    A class that contains options of storing data for analysis.
+
+    Parameters:
+        store_path(str): a path to store data
+        output_format(str): format of the file, either "csv", or
+        "parquet" and "feather", which require pyarrow
+    """
+    store_path: str = dirname(realpath(__file__))
+    output_format: Literal["csv", "parquet", "feather"] = "csv"
+
+    def __post_init__(self):
+        """
+        Validates parameters once, on construction, so that
+        invalid ones fail before measuring distances for each pair of lects
+        """
+        if self.output_format not in ["csv", "parquet", "feather"]:
+            raise ValueError("Only csv, parquet and feather formats are available")
+        if self.output_format != "csv":
+            try:
+                # pylint: disable=import-outside-toplevel,unused-import
+                import pyarrow
+            except ImportError as e:
+                raise ImportError(
+                    f"pyarrow is required for {self.output_format} format") from e
 
 def save_data_for_analysis(
         data_for_analysis: tuple[dict, dict],
         metrics_name: str,
         lect_a_name: str,
         lect_b_name: str,
-        store_path: str = dirname(realpath(__file__))) -> None:
+        store_path: str | AnalysisParameters = AnalysisParameters()) -> None:
     """
-    Takes results of measurements and saves them to .csv file.
+    Takes results of measurements and saves them to .csv, .parquet
+    or .feather file; if there is no data for analysis, no file is written.
 
     Parameters:
         data_for_analysis(tuple[dict, dict]): dicts with n-grams as keys, 
@@ -22,39 +172,32 @@ def save_data_for_analysis(
         metrics_name(str): name of metrics
         lect_a_name(str): name of the first lect
         lect_b_name(str): name of the second lect
-        store_path(str): a path to store data
+        store_path(str | AnalysisParameters): a path to store data, or
+        a path together with format of the file, for details
+        see AnalysisParameters documentation; a path alone is stored as .csv
     """
-    if not isdir(store_path):
-        raise ValueError(f'Path {store_path} does not exist')
-    errors_list = []
-    if data_for_analysis[0]:
-        for i in data_for_analysis[0].keys():
-            errors_list.append([i, "id.", metrics_name + " - DistRank", data_for_analysis[0][i]])
-    if data_for_analysis[1]:
-    # as two first columns are lect, for their respective arrays first two
-    # columns should be filled correspondingly
-        if data_for_analysis[1][0]:
-            # recording information for each n-gram
-            for i in data_for_analysis[1][0].keys():
-                # recording information for each n-gram of other lect that has
-                # minimal distance with this n-gram
-                for j in data_for_analysis[1][0][i]:
-                    other_lect_n_gram = j[0]
-                    distance = j[1]
-                    errors_list.append([i, other_lect_n_gram, metrics_name + " - hybrid",
-                                        distance])
-        if data_for_analysis[1][1]:
-            for i in data_for_analysis[1][1].keys():
-                for j in data_for_analysis[1][1][i]:
-                    other_lect_n_gram = j[0]
-                    distance = j[1]
-                    errors_list.append([other_lect_n_gram, i, metrics_name + " - hybrid",
-                                        distance])
-    errors_data = DataFrame(
-        errors_list, columns=[lect_a_name, lect_b_name, metrics_name, "Distance"]
-        )
-    errors_data.to_csv(
-        join(
-            store_path, metrics_name + "_" + lect_a_name + "_" + lect_b_name + ".csv"
-            ), index=False
-        )
+    if isinstance(store_path, AnalysisParameters):
+        store_path, output_format = store_path.store_path, store_path.output_format
+    else:
+        output_format = "csv"
+    _ensure_dir(store_path)
+    values = _columns_for_analysis(data_for_analysis, metrics_name)
+    if not values[3]:
+        # there are no rows to write, so no file is created
+        logging.debug("No data for analysis for %s and %s", lect_a_name, lect_b_name)
+        return
+    columns = [lect_a_name, lect_b_name, metrics_name, "Distance"]
+    path = f"{store_path}{_SEP}{metrics_name}_{lect_a_name}_{lect_b_name}.{output_format}"
+    if output_format == "csv":
+        with open(path, 'w', newline='', encoding='utf-8',
+                  buffering=_BUFFER_SIZE) as out:
+            writer = csv.writer(out, dialect="corpus_distance")
+            writer.writerow(columns)
+            # rows are zipped from the columns lazily, without copying them;
+            # distances are formatted with 6 significant digits, which is
+            # more than enough for comparing n-grams, instead of up to 17 of repr
+            writer.writerows(zip(
+                values[0], values[1], values[2],
+                (f"{distance:.6g}" for distance in values[3])))
+        return
+    _write_columnar(values, columns, path, output_format)
@@ -13,7 +13,7 @@ from corpus_distance.distance_measurement.frequency_metrics\
 
 
 
-@dataclass
+@dataclass(slots=True)
 class LectPairInformation:
     """
     A class that contains information on the pair of lects,
@@ -94,23 +94,24 @@ def hybrid_for_single_lect(lects_information: LectPairInformation,
                                         alphabet_normalisation = alphabet_normalisation
                                         ))
                                     /max(len(a[0]), len(b[0]))))
-            # the next stage is two score the minimal value
-            # of string similarity measure,
-            # the closest possible n-gram difference between
-            # n-gram of lect a and given n-gram of lect b
-            min_diff = min(
-               list((i[2] for i in differences_for_a_single_n_gram))
-               )
-            # save only such n-grams of b
-            # the distance to which matches minimal one
-            b_n_grams_with_min_diff =\
-                [i for i in differences_for_a_single_n_gram\
-                if i[2] == min_diff]
-            # score hybrid measure and transform the result for output
-            b_n_grams_with_min_diff = [(
-               i[0], (1 - ((1 - i[1]) * (1 - min_diff)))
-               ) for i in b_n_grams_with_min_diff]
-            diffs_with_b[a[0]] = b_n_grams_with_min_diff
+        # the next stage is two score the minimal value
+        # of string similarity measure,
+        # the closest possible n-gram difference between
+        # n-gram of lect a and given n-gram of lect b;
+        # it is scored once, after all the n-grams of b are compared
+        min_diff = min(
+           list((i[2] for i in differences_for_a_single_n_gram))
+           )
+        # save only such n-grams of b
+        # the distance to which matches minimal one
+        b_n_grams_with_min_diff =\
+            [i for i in differences_for_a_single_n_gram\
+            if i[2] == min_diff]
+        # score hybrid measure and transform the result for output
+        b_n_grams_with_min_diff = [(
+           i[0], (1 - ((1 - i[1]) * (1 - min_diff)))
+           ) for i in b_n_grams_with_min_diff]
+        diffs_with_b[a[0]] = b_n_grams_with_min_diff
     return diffs_with_b
 
 
@@ -5,19 +5,82 @@ texts in the dataset
 """
 
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from os.path import dirname, isdir, realpath
 from pandas import DataFrame
-from corpus_distance.distance_measurement.analysis import save_data_for_analysis
+from corpus_distance.distance_measurement.analysis\
+    import save_data_for_analysis, AnalysisParameters
 from corpus_distance.distance_measurement.hybridisation\
     import compare_lects_with_vectors, HybridisationParameters, LectPairInformation
 from corpus_distance.cdutils import get_unique_pairs, get_lects_from_dataframe
 
 
+def _get_lects_data(df: DataFrame) -> dict[str, tuple[list, dict, float]]:
+    """
+    Gets required data for each lect from the dataframe once,
+    as each lect takes part in several pairs
+
+    Parameters:
+        df(DataFrame): dataset with data
+    Returns:
+        lects_data(dict[str, tuple[list, dict, float]]): lect names as keys,
+        and relative frequencies of n-grams, symbol vectors and alphabet
+        entropy as values
+    """
+    lects_data = {}
+    for lect in get_lects_from_dataframe(df):
+        row = df[df['lect'] == lect].iloc[0]
+        lects_data[lect] = (
+            row['relative_frequency_n_grams'], row['lect_vectors'], row['lect_info'])
+    return lects_data
+
+
+def _score_lect_pair(
+        pair: tuple[str, str],
+        lects_data: dict[str, tuple[list, dict, float]],
+        hybridisation_parameters: HybridisationParameters
+        ) -> tuple[tuple[dict, dict], int|float]:
+    """
+    Scores distance between a pair of lects
+
+    Parameters:
+        pair(tuple[str, str]): names of lects
+        lects_data(dict[str, tuple[list, dict, float]]): relative frequencies
+        of n-grams, symbol vectors and alphabet entropy for each lect
+        hybridisation_parameters(HybridisationParameters): a set of parameters
+        for hybridisation
+    Returns:
+        results(tuple[tuple[dict, dict], int|float]): data for analysis
+        and distance between the lects, see compare_lects_with_vectors
+    """
+    lect_1, lect_vectors_1, lect_info_1 = lects_data[pair[0]]
+    lect_2, lect_vectors_2, lect_info_2 = lects_data[pair[1]]
+    lects_for_analysis = LectPairInformation(
+        lect_1, lect_2,
+        lect_vectors_1, lect_vectors_2,
+        lect_info_1, lect_info_2)
+    return compare_lects_with_vectors(lects_for_analysis, hybridisation_parameters)
+
+
+def _raise_saving_errors(saved: list[Future]) -> None:
+    """
+    Waits for data for analysis to be written in background threads,
+    and re-raises errors that occurred while writing
+
+    Parameters:
+        saved(list[Future]): futures of save_data_for_analysis calls
+    """
+    for future in saved:
+        future.result()
+
+
 def score_metrics_for_corpus_dataset(
     df: DataFrame,
     store_path: str = dirname(realpath(__file__)),
     metrics_name: str = "hybrid measurement",
     hybridisation_parameters: HybridisationParameters = HybridisationParameters(),
+    output_format: str = "csv"
     ) -> list[tuple[tuple[str,str], int|float]]:
     """
     A function that takes dataset, metrics name and parameters for hybridisation,
@@ -28,6 +91,8 @@ def score_metrics_for_corpus_dataset(
         metrics_name(str): name of metrics
         hybridisation_parameters(HybridisationParameters): a set of parameters
         for hybridisation
+        output_format(str): format of files with data for analysis,
+        either "csv", "parquet", or "feather"
     Returns:
         overall_results(list[tuple[tuple[str,str], int|float]]): a list of measurements for each
         pair of lects in a consecutive order with pair names
@@ -36,35 +101,28 @@ def score_metrics_for_corpus_dataset(
         raise ValueError("No df provided")
     if not isdir(store_path):
         raise ValueError(f'Path {store_path} does not exist')
+    # output options are validated here, before scoring any pair,
+    # as files are saved in background threads
+    analysis_parameters = AnalysisParameters(store_path, output_format)
+    lects_data = _get_lects_data(df)
     # declare arrays
     # calculate distances for each pair of lects
     overall_results = []
-    for i in get_unique_pairs(get_lects_from_dataframe(df)):
-        logging.info("Starting scoring %s for %s and %s",
-                    metrics_name, i[0], i[1])
-        # getting required data for each lect from the dataframe
-        lect_1 = list(df[df['lect'] == i[0]]['relative_frequency_n_grams'])[0]
-        lect_2 = list(df[df['lect'] == i[1]]['relative_frequency_n_grams'])[0]
-
-        lect_info_1 = list(df[df['lect'] == i[0]]['lect_info'])[0]
-        lect_info_2 = list(df[df['lect'] == i[1]]['lect_info'])[0]
-
-        lect_vectors_1 = list(df[df['lect'] == i[0]]['lect_vectors'])[0]
-        lect_vectors_2 = list(df[df['lect'] == i[1]]['lect_vectors'])[0]
-
-        lects_for_analysis = LectPairInformation(
-            lect_1, lect_2,
-            lect_vectors_1, lect_vectors_2,
-            lect_info_1, lect_info_2)
-
-        # run metric and save the final results
-        analysis_data, result = compare_lects_with_vectors(
-            lects_for_analysis,
-            hybridisation_parameters
-        )
-        logging.info("Storing results in %s", store_path)
-        save_data_for_analysis(analysis_data, metrics_name, i[0], i[1], store_path)
-        logging.info("%s for %s and %s is %s", metrics_name, i[0], i[1], result)
-        overall_results.append((i, result))
+    saved = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for i in get_unique_pairs(list(lects_data)):
+            logging.info("Starting scoring %s for %s and %s",
+                        metrics_name, i[0], i[1])
+            # run metric and save the final results
+            analysis_data, result = _score_lect_pair(
+                i, lects_data, hybridisation_parameters)
+            logging.info("Storing results in %s", store_path)
+            # files of different pairs are independent, so they are written
+            # in background threads while the next pair is being scored
+            saved.append(ex.submit(save_data_for_analysis, analysis_data, metrics_name,
+                                   i[0], i[1], analysis_parameters))
+            logging.info("%s for %s and %s is %s", metrics_name, i[0], i[1], result)
+            overall_results.append((i, result))
+        _raise_saving_errors(saved)
     logging.info("Resulting distances are %s", overall_results)
     return overall_results
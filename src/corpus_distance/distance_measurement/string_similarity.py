@@ -11,7 +11,9 @@ from pyjarowinkler.distance import get_jaro_distance as jw
 
 
 
-@dataclass
+# slots make construction and attribute access cheaper,
+# as an object is created for each compared pair of n-grams
+@dataclass(slots=True)
 class StringSimilarityMeasurementInfo:
     """
     Contains information on possible set of parameters
@@ -13,6 +13,7 @@ from corpus_distance.cdutils import get_lects_from_dataframe
 from corpus_distance.data_preprocessing.data_pipeline import assemble_dataset
 from corpus_distance.data_preprocessing.topic_modelling import LDAParams
 from corpus_distance.data_preprocessing.vectorisation import FastTextParams
+from corpus_distance.distance_measurement.analysis import AnalysisParameters
 from corpus_distance.distance_measurement.hybridisation import HybridisationParameters
 from corpus_distance.clusterisation.clusterisation import ClusterisationParameters
 from corpus_distance.distance_measurement.metrics_pipeline import score_metrics_for_corpus_dataset
@@ -61,6 +62,8 @@ class ConfigurationParameters:
         either collected automatically, or input by user
         clusterisation_parameters(ClusterisationParameters): settings for 
         clusterisation, for details see ClusterisationParameters documentation
+        output_format(str): format of files with data for analysis,
+        either "csv", or "parquet" and "feather", which require pyarrow
     """
 
     store_path: str = "default"
@@ -68,6 +71,7 @@ class ConfigurationParameters:
     hybridisation_parameters: HybridisationParameters = HybridisationParameters()
     metrics_name: str = "default_metrics_name"
     clusterisation_parameters: ClusterisationParameters = ClusterisationParameters()
+    output_format: str = "csv"
 
 
 
@@ -103,15 +107,11 @@ def set_lda_params(lda_cfg: dict) -> LDAParams:
     Returns:
         lda_params(LDAParams): full set of LDAParams for the model to train on 
     """
-    lda_params = LDAParams()
-    if lda_cfg["num_topics"]:
-        lda_params.num_topics = lda_cfg["num_topics"]
-    if lda_cfg["alpha"]:
-        lda_params.alpha = lda_cfg["alpha"]
-    if lda_cfg["epochs"]:
-        lda_params.epochs = lda_cfg["epochs"]
-    if lda_cfg["passes"]:
-        lda_params.passes = lda_cfg["passes"]
+    # passing user values to the constructor, so that they are validated
+    lda_params = LDAParams(**{
+        key: lda_cfg[key] for key in ["num_topics", "alpha", "epochs", "passes", "workers"]
+        if lda_cfg.get(key) is not None
+        })
     return lda_params
 
 
@@ -295,6 +295,12 @@ def set_configuration(cfg: dict) -> ConfigurationParameters:
                 cfg_params.metrics_name,
                 cfg_params.store_path
                 )
+    # the key is optional, so that configurations without it still work
+    if cfg.get("output_format"):
+        # format and pyarrow are checked on construction,
+        # before any models are trained
+        AnalysisParameters(output_format=cfg["output_format"])
+        cfg_params.output_format = cfg["output_format"]
     return cfg_params
 
 
@@ -325,7 +331,8 @@ def perform_clusterisation(config_path: str = 'default') -> None:
         data,
         cfg.store_path,
         cfg.metrics_name,
-        cfg.hybridisation_parameters
+        cfg.hybridisation_parameters,
+        cfg.output_format
         )
     cfg.clusterisation_parameters.lects = get_lects_from_dataframe(data)
     logging.info("Initialising clusterisation")